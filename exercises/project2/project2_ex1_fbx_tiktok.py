@@ -6,14 +6,20 @@ This script uses typer to create a CLI tool that:
 3. Automatically follows the character's animation with smooth tracking
 """
 
+import contextlib
+import math
+import os
 from pathlib import Path
-from typing import Optional
+from typing import ContextManager, Iterable, Optional, Sequence, TypeVar
 
 import bpy
+import numpy as np
 import typer
-from mathutils import Vector
+from bpy_extras import anim_utils
 from typing_extensions import Annotated
 
+T = TypeVar("T")
+
 app = typer.Typer(help="Import FBX and create TikTok-style camera automation")
 
 SAVE_NAME = "week2ex4_tiktok.blend"
@@ -23,42 +29,53 @@ FRAME_STEP = 5  # Bake keyframes every N frames
 CAMERA_DISTANCE = 2.5  # Distance from target in meters
 CAMERA_HEIGHT_OFFSET = 1.5  # Height above target center
 TARGET_BONE_NAME = "mixamorig:Hips"  # Common Mixamo bone name
+_PI_180 = math.pi / 180.0  # Degrees -> radians factor
+_DEFAULT_ROT_RAD = (math.pi * 0.5, 0.0, 0.0)  # +90° X: PLY Z-forward -> Z-up
+_BEZIER = bpy.types.Keyframe.bl_rna.properties["interpolation"].enum_items["BEZIER"].value
 
 
-import math
-
+def import_ply(
+    ply_path: Path,
+    known_objects: Optional[set[int]] = None,
+    check_exists: bool = True,
+    verbose: bool = False,
+) -> list[bpy.types.Object]:
+    """Import a PLY pointcloud file and return the imported objects.
 
-def import_ply(ply_path: Path) -> list[bpy.types.Object]:
-    """Import a PLY pointcloud file and return the imported objects."""
-    if not ply_path.exists():
+    ``known_objects`` holds ``as_pointer()`` values of objects already in the
+    file. Pass the same set across a batch so each import only needs one pass
+    over ``bpy.data.objects``; it is updated with the newly imported objects.
+    Pass ``check_exists=False`` for paths already verified by a directory scan.
+    Progress messages are only printed when ``verbose`` is set.
+    """
+    if check_exists and not ply_path.exists():
         typer.secho(f"Error: PLY file not found: {ply_path}", fg=typer.colors.RED)
         raise typer.Exit(code=1)
 
-    typer.echo(f"Importing PLY: {ply_path}")
-    objects_before = set(bpy.data.objects)
+    if known_objects is None:
+        known_objects = {o.as_pointer() for o in bpy.data.objects}
+
+    if verbose:
+        typer.echo(f"Importing PLY: {ply_path}")
     bpy.ops.wm.ply_import(filepath=str(ply_path))
-    objects_after = set(bpy.data.objects)
-    imported = list(objects_after - objects_before)
-    typer.secho(f"✓ Imported {len(imported)} object(s) from {ply_path.name}", fg=typer.colors.GREEN)
+    imported = [o for o in bpy.data.objects if o.as_pointer() not in known_objects]
+    known_objects.update(o.as_pointer() for o in imported)
+    if verbose:
+        typer.secho(f"✓ Imported {len(imported)} object(s) from {ply_path.name}", fg=typer.colors.GREEN)
     return imported
 
 
 def name_and_rotate_pointcloud(
     obj: bpy.types.Object,
     name: str = "Pointcloud",
-    rotation_deg: tuple[float, float, float] = (0.0, 0.0, 0.0),
+    rotation_rad: tuple[float, float, float] = (0.0, 0.0, 0.0),
+    verbose: bool = False,
 ) -> None:
-    """Rename the object and apply rotation (in degrees, converted to radians)."""
+    """Rename the object and apply rotation (already in radians)."""
     obj.name = name
-    obj.rotation_euler = (
-        math.radians(rotation_deg[0]),
-        math.radians(rotation_deg[1]),
-        math.radians(rotation_deg[2]),
-    )
-    typer.secho(
-        f"✓ Named '{name}', rotation={rotation_deg[0]}°, {rotation_deg[1]}°, {rotation_deg[2]}°",
-        fg=typer.colors.GREEN,
-    )
+    obj.rotation_euler = rotation_rad
+    if verbose:
+        typer.secho(f"✓ Named and rotated '{name}'", fg=typer.colors.GREEN)
 
 
 def append_radiance_field_node_group(blend_path: Path) -> bpy.types.NodeTree:
@@ -73,49 +90,44 @@ def append_radiance_field_node_group(blend_path: Path) -> bpy.types.NodeTree:
         return bpy.data.node_groups[RADIANCE_FIELD_NODE_GROUP]
 
     typer.echo(f"Appending node group '{RADIANCE_FIELD_NODE_GROUP}' from {blend_path.name}")
-    bpy.ops.wm.append(
-        filepath=str(blend_path) + f"/NodeTree/{RADIANCE_FIELD_NODE_GROUP}",
-        directory=str(blend_path) + "/NodeTree/",
-        filename=RADIANCE_FIELD_NODE_GROUP,
-    )
+    with bpy.data.libraries.load(str(blend_path), link=False) as (data_from, data_to):
+        if RADIANCE_FIELD_NODE_GROUP not in data_from.node_groups:
+            typer.secho(
+                f"Error: Node group '{RADIANCE_FIELD_NODE_GROUP}' not found in {blend_path.name}.",
+                fg=typer.colors.RED,
+            )
+            raise typer.Exit(code=1)
+        data_to.node_groups = [RADIANCE_FIELD_NODE_GROUP]
 
-    if RADIANCE_FIELD_NODE_GROUP not in bpy.data.node_groups:
+    # data_to now holds the appended datablock (name may differ if one already existed)
+    node_group = data_to.node_groups[0]
+    if node_group is None:
         typer.secho(
-            f"Error: Could not find node group '{RADIANCE_FIELD_NODE_GROUP}' after append.",
+            f"Error: Could not append node group '{RADIANCE_FIELD_NODE_GROUP}'.",
             fg=typer.colors.RED,
         )
         raise typer.Exit(code=1)
 
     typer.secho(f"✓ Appended node group '{RADIANCE_FIELD_NODE_GROUP}'", fg=typer.colors.GREEN)
-    return bpy.data.node_groups[RADIANCE_FIELD_NODE_GROUP]
-
-
-def apply_radiance_field_to_object(
-    obj: bpy.types.Object, node_group: bpy.types.NodeTree
-) -> None:
-    """Add a GeometryNodes modifier to obj and assign the RadianceField node group."""
-    mod = obj.modifiers.new(name="GeometryNodes", type="NODES")
-    mod.node_group = node_group
-    typer.secho(
-        f"✓ Applied '{RADIANCE_FIELD_NODE_GROUP}' geometry nodes to '{obj.name}'",
-        fg=typer.colors.GREEN,
-    )
+    return node_group
 
 
-def set_bounding_box(
+def apply_radiance_field(
     obj: bpy.types.Object,
+    node_group: bpy.types.NodeTree,
     bbox: tuple[float, float, float] = (4.0, 4.0, 8.0),
+    verbose: bool = False,
 ) -> None:
-    """Set Socket_3 (bounding box vector) on the GeometryNodes modifier."""
-    mod = obj.modifiers.get("GeometryNodes")
-    if mod is None:
-        typer.secho(f"Warning: No GeometryNodes modifier on '{obj.name}'", fg=typer.colors.YELLOW)
-        return
+    """Add a GeometryNodes modifier with the RadianceField node group and set
+    Socket_3 (bounding box vector) on it in one go."""
+    mod = obj.modifiers.new(name="GeometryNodes", type="NODES")
+    mod.node_group = node_group
     mod["Socket_3"] = bbox
-    typer.secho(
-        f"✓ Bounding box set to {bbox} on '{obj.name}'",
-        fg=typer.colors.GREEN,
-    )
+    if verbose:
+        typer.secho(
+            f"✓ Applied '{RADIANCE_FIELD_NODE_GROUP}' geometry nodes to '{obj.name}', bounding box {bbox}",
+            fg=typer.colors.GREEN,
+        )
 
 
 def place_character(
@@ -185,53 +197,36 @@ def import_fbx(fbx_path: Path) -> list[bpy.types.Object]:
     typer.echo(f"Importing FBX: {fbx_path}")
 
     # Get objects before import
-    objects_before = set(bpy.data.objects)
+    known_objects = {o.as_pointer() for o in bpy.data.objects}
 
     # Import FBX (bpy 5.x: operator moved to bpy.ops.wm.fbx_import)
     bpy.ops.wm.fbx_import(filepath=str(fbx_path))
 
-    # Get newly imported objects
-    objects_after = set(bpy.data.objects)
-    imported_objects = list(objects_after - objects_before)
+    # Get newly imported objects in a single pass (bpy.data.objects is in name order)
+    imported_objects = [o for o in bpy.data.objects if o.as_pointer() not in known_objects]
 
     typer.secho(f"✓ Imported {len(imported_objects)} objects", fg=typer.colors.GREEN)
     return imported_objects
 
 
 def find_armature(
-    imported_objects: list[bpy.types.Object],
+    imported_objects: Iterable[bpy.types.Object],
 ) -> Optional[bpy.types.Object]:
-    """Find the armature object from imported objects."""
-    for obj in imported_objects:
-        if obj.type == "ARMATURE":
-            return obj
-    return None
-
-
-def get_target_world_location(
-    armature: bpy.types.Object, bone_name: str
-) -> tuple[float, float, float]:
-    """Get world location of a bone in the armature."""
-    if bone_name in armature.pose.bones:
-        bone = armature.pose.bones[bone_name]
-        matrix = armature.matrix_world @ bone.matrix
-        return tuple(matrix.translation)
-
-    # Fallback to armature origin
-    return tuple(armature.matrix_world.translation)
+    """Find the first armature object, stopping as soon as one is found."""
+    return next((obj for obj in imported_objects if obj.type == "ARMATURE"), None)
 
 
 def create_tiktok_camera(name: str = "TikTokCamera") -> bpy.types.Object:
     """Create a camera optimized for TikTok-style vertical video."""
-    bpy.ops.object.camera_add()
-    camera = bpy.context.active_object
-    camera.name = name
-    camera.data.name = f"{name}_data"
+    cam_data = bpy.data.cameras.new(f"{name}_data")
 
     # Camera settings for portrait video
-    camera.data.lens = 50  # Standard focal length
-    camera.data.sensor_width = 36
-    camera.data.sensor_height = 36 * (16 / 9)  # Adjust sensor for vertical
+    cam_data.lens = 50  # Standard focal length
+    cam_data.sensor_width = 36
+    cam_data.sensor_height = 36 * (16 / 9)  # Adjust sensor for vertical
+
+    camera = bpy.data.objects.new(name, cam_data)
+    bpy.context.collection.objects.link(camera)
 
     # Set as active camera
     bpy.context.scene.camera = camera
@@ -239,86 +234,180 @@ def create_tiktok_camera(name: str = "TikTokCamera") -> bpy.types.Object:
     return camera
 
 
+def write_fcurve(
+    action: bpy.types.Action,
+    datablock: bpy.types.ID,
+    data_path: str,
+    index: int,
+    frames: np.ndarray,
+    values: np.ndarray,
+) -> bpy.types.FCurve:
+    """Bulk-write keyframes into an FCurve with foreach_set instead of keyframe_insert."""
+    fcu = action.fcurve_ensure_for_datablock(datablock, data_path, index=index)
+    count = len(frames)
+    co = np.empty(2 * count, dtype=np.float32)
+    co[0::2] = frames
+    co[1::2] = values
+
+    fcu.keyframe_points.add(count)
+    fcu.keyframe_points.foreach_set("co", co)
+    fcu.keyframe_points.foreach_set("interpolation", np.full(count, _BEZIER, dtype=np.int32))
+    fcu.update()  # Recalculate handles once for the whole curve
+    return fcu
+
+
+def sample_bone_head_from_action(
+    armature: bpy.types.Object,
+    pose_bone: bpy.types.PoseBone,
+    frames: list[int],
+) -> Optional[np.ndarray]:
+    """Evaluate a bone's location FCurves directly to get its world head position.
+
+    Skips frame_set entirely. Only valid when the bone's own location curves are
+    the only thing that moves it: a root bone with no constraints, on an
+    armature whose object transform is static. Returns None otherwise so the
+    caller can fall back to sampling with frame_set.
+    """
+    bone = pose_bone.bone
+    if pose_bone.parent is not None or pose_bone.constraints or not bone.use_local_location:
+        return None
+    if armature.parent is not None or armature.constraints:
+        return None
+
+    anim = armature.animation_data
+    if anim is None or anim.action is None or anim.drivers or anim.nla_tracks:
+        return None
+    channelbag = anim_utils.action_get_channelbag_for_slot(anim.action, anim.action_slot)
+    if channelbag is None:
+        return None
+
+    # Any object-level curve means matrix_world changes over time
+    if any(not fcu.data_path.startswith("pose.bones[") for fcu in channelbag.fcurves):
+        return None
+
+    # Channels without a curve keep their current value
+    location_path = pose_bone.path_from_id("location")
+    locations = np.tile(np.array(pose_bone.location, dtype=np.float64), (len(frames), 1))
+    for fcu in channelbag.fcurves:
+        if fcu.data_path == location_path:
+            locations[:, fcu.array_index] = [fcu.evaluate(frame) for frame in frames]
+
+    # Root bone head = object matrix @ rest matrix @ location (rotation/scale don't move the head).
+    # With no parent or constraints matrix_basis equals matrix_world, and unlike
+    # matrix_world it doesn't wait for a depsgraph update after placing the character.
+    matrix = np.array(armature.matrix_basis @ bone.matrix_local)
+    return locations @ matrix[:3, :3].T + matrix[:3, 3]
+
+
 def setup_camera_tracking(
     camera: bpy.types.Object,
     target: bpy.types.Object,
     bone_name: Optional[str] = None,
     frame_start: int = 1,
     frame_end: int = 250,
+    verbose: bool = False,
 ) -> None:
-    """Setup camera to follow the target with baked keyframes."""
-    typer.echo(f"Setting up camera tracking from frame {frame_start} to {frame_end}")
+    """Setup camera to follow the target with baked location keyframes.
 
-    # Clear existing animation data
-    if camera.animation_data:
-        camera.animation_data_clear()
-
-    scene = bpy.context.scene
-
-    # Bake keyframes
-    for frame in range(frame_start, frame_end + 1, FRAME_STEP):
-        scene.frame_set(frame)
+    Look-at is handled by a DAMPED_TRACK constraint on the target (or bone).
+    Progress messages are only printed when ``verbose`` is set.
+    """
+    if verbose:
+        typer.echo(f"Setting up camera tracking from frame {frame_start} to {frame_end}")
 
-        # Get target location
-        if target.type == "ARMATURE" and bone_name:
-            target_loc = get_target_world_location(target, bone_name)
-        else:
-            target_loc = tuple(target.matrix_world.translation)
+    # Only a reused camera carries an old bake; fresh ones from create_tiktok_camera don't
+    if camera.animation_data and camera.animation_data.action:
+        camera.animation_data_clear()
 
-        # Position camera behind and above target
-        camera.location = (
-            target_loc[0],
-            target_loc[1] - CAMERA_DISTANCE,
-            target_loc[2] + CAMERA_HEIGHT_OFFSET,
-        )
+    # Keep the camera unselected during the bake so no gizmo updates fire on writes
+    camera.select_set(False)
 
-        # Point camera at target
-        direction = Vector(
-            (
-                target_loc[0] - camera.location[0],
-                target_loc[1] - camera.location[1],
-                target_loc[2] - camera.location[2],
-            )
+    scene = bpy.context.scene
+    # Sample every FRAME_STEP frames and let Bezier interpolation fill the gaps;
+    # always key frame_end so the tail doesn't hold the last sample
+    frames = list(range(frame_start, frame_end + 1, FRAME_STEP))
+    if frames and frames[-1] != frame_end:
+        frames.append(frame_end)
+
+    # Resolve the pose bone once; falls back to the object origin if missing
+    pose_bone = None
+    if target.type == "ARMATURE" and bone_name:
+        pose_bone = target.pose.bones.get(bone_name)
+
+    targets = None
+    if pose_bone is not None:
+        targets = sample_bone_head_from_action(target, pose_bone, frames)
+
+    if targets is None:
+        # Sample target positions with full scene evaluation.
+        # matrix_world is re-read after each frame_set since the target may be animated.
+        targets = np.empty((len(frames), 3), dtype=np.float64)
+        for i, frame in enumerate(frames):
+            scene.frame_set(frame)
+
+            if pose_bone is not None:
+                targets[i] = (target.matrix_world @ pose_bone.matrix).translation
+            else:
+                targets[i] = target.matrix_world.translation
+
+    # Position camera behind and above target, all frames at once
+    locations = targets + np.array([0.0, -CAMERA_DISTANCE, CAMERA_HEIGHT_OFFSET])
+
+    # Point camera at target: evaluated by Blender per frame, so only location is baked
+    con = camera.constraints.get("TrackTarget")
+    if con is None:
+        con = camera.constraints.new("DAMPED_TRACK")
+        con.name = "TrackTarget"
+    con.target = target
+    con.subtarget = pose_bone.name if pose_bone is not None else ""
+    con.track_axis = "TRACK_NEGATIVE_Z"
+
+    # Build FCurves directly, no per-keyframe insert or scene update
+    action = bpy.data.actions.new(f"{camera.name}_track")
+    camera.animation_data_create().action = action
+    frame_values = np.asarray(frames, dtype=np.float32)
+    for axis in range(3):
+        write_fcurve(action, camera, "location", axis, frame_values, locations[:, axis])
+
+    # Flush the depsgraph once for all of the bulk writes above
+    camera.update_tag()
+    bpy.context.view_layer.update()
+
+    if verbose:
+        typer.secho(
+            f"✓ Baked {len(frames)} keyframes",
+            fg=typer.colors.GREEN,
         )
 
-        # Calculate rotation to look at target
-        rot_quat = camera.rotation_euler.to_quaternion()
-        track_quat = direction.to_track_quat("-Z", "Y")
-        camera.rotation_euler = track_quat.to_euler()
-
-        # Insert keyframes
-        camera.keyframe_insert(data_path="location", frame=frame)
-        camera.keyframe_insert(data_path="rotation_euler", frame=frame)
-
-    typer.secho(
-        f"✓ Baked {(frame_end - frame_start) // FRAME_STEP + 1} keyframes",
-        fg=typer.colors.GREEN,
-    )
-
 
 def add_studio_lighting() -> None:
     """Add basic three-point lighting setup."""
     typer.echo("Adding studio lighting")
 
+    collection = bpy.context.collection
+
     # Key light
-    bpy.ops.object.light_add(type="AREA", location=(2, -2, 4))
-    key_light = bpy.context.active_object
-    key_light.name = "KeyLight"
-    key_light.data.energy = 200
-    key_light.data.size = 2
+    key_data = bpy.data.lights.new("KeyLight", type="AREA")
+    key_data.energy = 200
+    key_data.size = 2
+    key_light = bpy.data.objects.new("KeyLight", key_data)
+    key_light.location = (2, -2, 4)
+    collection.objects.link(key_light)
 
     # Fill light
-    bpy.ops.object.light_add(type="AREA", location=(-2, -1, 2))
-    fill_light = bpy.context.active_object
-    fill_light.name = "FillLight"
-    fill_light.data.energy = 100
-    fill_light.data.size = 2
+    fill_data = bpy.data.lights.new("FillLight", type="AREA")
+    fill_data.energy = 100
+    fill_data.size = 2
+    fill_light = bpy.data.objects.new("FillLight", fill_data)
+    fill_light.location = (-2, -1, 2)
+    collection.objects.link(fill_light)
 
     # Rim light
-    bpy.ops.object.light_add(type="SPOT", location=(0, 2, 3))
-    rim_light = bpy.context.active_object
-    rim_light.name = "RimLight"
-    rim_light.data.energy = 150
+    rim_data = bpy.data.lights.new("RimLight", type="SPOT")
+    rim_data.energy = 150
+    rim_light = bpy.data.objects.new("RimLight", rim_data)
+    rim_light.location = (0, 2, 3)
+    collection.objects.link(rim_light)
 
     typer.secho("✓ Lighting setup complete", fg=typer.colors.GREEN)
 
@@ -432,6 +521,17 @@ def save_blend_file(output_path: Optional[Path] = None) -> None:
     typer.secho(f"✓ Saved: {output_path}", fg=typer.colors.GREEN)
 
 
+def _progress(items: Sequence[T], label: str, verbose: bool) -> ContextManager[Iterable[T]]:
+    """Progress bar for quiet batch runs; a plain step line when verbose messages print.
+
+    click redraws the bar in place, so per-item messages would land on the bar line.
+    """
+    if verbose:
+        typer.echo(f"{label}...")
+        return contextlib.nullcontext(items)
+    return typer.progressbar(items, label=label)
+
+
 @app.command()
 def create(
     fbx_file: Annotated[Path, typer.Argument(help="Path to the FBX file to import")],
@@ -500,7 +600,7 @@ def create(
 
     # Step 6: Setup tracking
     typer.echo("5. Setting up camera tracking...")
-    setup_camera_tracking(camera, target, target_bone, start_frame, end_frame)
+    setup_camera_tracking(camera, target, target_bone, start_frame, end_frame, verbose=True)
 
     # Step 7: Add lighting
     if not no_lights:
@@ -606,12 +706,22 @@ def import_pointcloud_cmd(
         ply_files = [pointcloud]
     else:
         pointcloud_dir = pointcloud_dir.expanduser().resolve()
-        ply_files = sorted(pointcloud_dir.glob("*.ply"))
+        if not pointcloud_dir.is_dir():
+            typer.secho(f"Error: Pointcloud directory not found: {pointcloud_dir}", fg=typer.colors.RED)
+            raise typer.Exit(code=1)
+        # scandir's DirEntry.is_file() uses cached metadata: one stat per entry at most
+        with os.scandir(pointcloud_dir) as entries:
+            ply_files = sorted(
+                Path(entry.path) for entry in entries if entry.name.endswith(".ply") and entry.is_file()
+            )
         if not ply_files:
             typer.secho(f"Error: No .ply files found in {pointcloud_dir}", fg=typer.colors.RED)
             raise typer.Exit(code=1)
         typer.echo(f"Found {len(ply_files)} .ply file(s) in {pointcloud_dir}")
 
+    # --pointcloud runs keep per-step output; --pointcloud-dir batches show a progress bar
+    verbose = pointcloud is not None
+
     # Parse rotation (defaults to 0, 0, 0). +90° X base offset corrects PLY Z-forward → Z-up.
     rot: tuple[float, float, float]
     if rotation is not None:
@@ -619,8 +729,11 @@ def import_pointcloud_cmd(
             typer.secho("Error: --rotation requires exactly 3 values (X Y Z).", fg=typer.colors.RED)
             raise typer.Exit(code=1)
         rot = (rotation[0] + 90.0, rotation[1], rotation[2])
+        # Same rotation for every file, so convert to radians once
+        rad = (rot[0] * _PI_180, rot[1] * _PI_180, rot[2] * _PI_180)
     else:
         rot = (90.0, 0.0, 0.0)
+        rad = _DEFAULT_ROT_RAD
 
     typer.echo("1. Resetting scene...")
     reset_scene()
@@ -629,32 +742,43 @@ def import_pointcloud_cmd(
     typer.echo(f"2. Appending RadianceField node group from {radiance_field_blend.name}...")
     node_group = append_radiance_field_node_group(radiance_field_blend)
 
-    for i, ply_file in enumerate(ply_files):
-        typer.echo(f"3. Importing pointcloud {i + 1}/{len(ply_files)}: {ply_file.name}")
-        imported = import_ply(ply_file)
-        if not imported:
-            typer.secho(f"Warning: No objects imported from {ply_file.name}", fg=typer.colors.YELLOW)
-            continue
-
-        # Use the first (and typically only) imported mesh object
-        obj = next((o for o in imported if o.type == "MESH"), imported[0])
+    if bounding_box is not None:
+        if len(bounding_box) != 3:
+            typer.secho("Error: --bounding-box requires exactly 3 values (X Y Z).", fg=typer.colors.RED)
+            raise typer.Exit(code=1)
+        bbox = (bounding_box[0], bounding_box[1], bounding_box[2])
+    else:
+        bbox = (4.0, 4.0, 8.0)
+
+    # Phase 1: import every PLY before touching modifiers, so geometry-node
+    # setup isn't interleaved with imports
+    known_objects = {o.as_pointer() for o in bpy.data.objects}
+    pointclouds: list[tuple[bpy.types.Object, str]] = []
+    empty_files: list[str] = []
+    with _progress(ply_files, "3. Importing pointclouds", verbose) as bar:
+        for ply_file in bar:
+            # Directory entries were verified by the scan; a single --pointcloud path wasn't
+            imported = import_ply(
+                ply_file, known_objects, check_exists=pointcloud is not None, verbose=verbose
+            )
+            if not imported:
+                empty_files.append(ply_file.name)
+                continue
 
-        typer.echo(f"4. Naming and rotating '{obj.name}'...")
-        obj_name = "Pointcloud" if len(ply_files) == 1 else f"Pointcloud_{ply_file.stem}"
-        name_and_rotate_pointcloud(obj, name=obj_name, rotation_deg=rot)
+            # Use the first (and typically only) imported mesh object
+            obj = next((o for o in imported if o.type == "MESH"), imported[0])
+            obj_name = "Pointcloud" if len(ply_files) == 1 else f"Pointcloud_{ply_file.stem}"
+            pointclouds.append((obj, obj_name))
 
-        typer.echo("5. Applying RadianceField geometry nodes...")
-        apply_radiance_field_to_object(obj, node_group)
+    # Reported after the bar so warnings don't break up its output
+    for name in empty_files:
+        typer.secho(f"Warning: No objects imported from {name}", fg=typer.colors.YELLOW)
 
-        typer.echo("6. Setting bounding box...")
-        if bounding_box is not None:
-            if len(bounding_box) != 3:
-                typer.secho("Error: --bounding-box requires exactly 3 values (X Y Z).", fg=typer.colors.RED)
-                raise typer.Exit(code=1)
-            bbox = (bounding_box[0], bounding_box[1], bounding_box[2])
-        else:
-            bbox = (4.0, 4.0, 8.0)
-        set_bounding_box(obj, bbox)
+    # Phase 2: name, rotate and attach RadianceField in one batch
+    with _progress(pointclouds, "4. Applying RadianceField", verbose) as bar:
+        for obj, obj_name in bar:
+            name_and_rotate_pointcloud(obj, name=obj_name, rotation_rad=rad, verbose=verbose)
+            apply_radiance_field(obj, node_group, bbox, verbose=verbose)
 
     # --- Character import ---
     fbx_files: list[Path] = []
@@ -690,7 +814,7 @@ def import_pointcloud_cmd(
         for fbx_file in fbx_files:
             import_and_place_fbx(fbx_file, location=char_loc, rotation_deg=char_rot)
 
-    typer.echo("7. Saving blend file...")
+    typer.echo("5. Saving blend file...")
     # Auto-generate name from character + pointcloud stems if no explicit output given
     char_stem = fbx_files[0].stem if fbx_files else "scene"
     pc_stem = ply_files[0].stem if ply_files else "pointcloud"
@@ -709,20 +833,22 @@ def import_pointcloud_cmd(
         render_output_path.parent.mkdir(parents=True, exist_ok=True)
 
         # Set up TikTok camera and tracking, then re-save blend before rendering
-        armature = find_armature(list(bpy.data.objects))
+        armature = find_armature(bpy.data.objects)
         if armature:
             typer.echo("Setting up TikTok camera for render...")
             camera = create_tiktok_camera()
-            setup_camera_tracking(camera, armature, TARGET_BONE_NAME, start_frame, end_frame)
+            setup_camera_tracking(
+                camera, armature, TARGET_BONE_NAME, start_frame, end_frame, verbose=verbose
+            )
             add_studio_lighting()
 
-        typer.echo(f"8. Configuring render output: {render_output_path}")
+        typer.echo(f"6. Configuring render output: {render_output_path}")
         setup_render_output(render_output_path, fmt=render_format, frame_start=start_frame, frame_end=end_frame)
 
         # Re-save blend with render settings baked in
         save_blend_file(output)
 
-        typer.echo("9. Launching Blender for render...")
+        typer.echo("7. Launching Blender for render...")
         render_via_blender(
             blend_path=output,
             output_path=render_output_path,